@@ -1,7 +1,76 @@
 from typing import List, Dict, Tuple
-from sympy import isprime, primefactors, gcd, totient
-from math import factorial
+from sympy import isprime, primefactors, factorint, totient
+from math import gcd
+from collections import deque
+from functools import lru_cache
 import time
+import numpy as np
+from numba import njit
+
+
+SIEVE_LIMIT = 10 ** 6
+
+
+def eratosthenes_sieve(limit: int) -> bytearray:
+    """
+    Строит решето Эратосфена.
+    Parameters:
+    limit (int): Верхняя граница (включительно)
+    Returns:
+    bytearray, в котором sieve[n] == 1 тогда и только тогда, когда n простое
+    """
+    sieve = bytearray(b'\x01') * (limit + 1)
+    sieve[0] = 0
+    if limit >= 1:
+        sieve[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return sieve
+
+
+IS_PRIME = eratosthenes_sieve(SIEVE_LIMIT)
+
+
+@lru_cache(maxsize=None)
+def _isprime_cached(number: int) -> bool:
+    """
+    sympy.isprime с кэшированием: циклические перестановки разных чисел часто совпадают.
+    """
+    return bool(isprime(number))
+
+
+def _is_prime(number: int) -> bool:
+    """
+    Проверка на простоту: для чисел до SIEVE_LIMIT — по решету, для больших — через кэшированный sympy.isprime.
+    """
+    if number <= SIEVE_LIMIT:
+        return bool(IS_PRIME[number])
+    return _isprime_cached(number)
+
+
+def palindromes_below(limit: int) -> List[int]:
+    """
+    Строит все палиндромные числа от 1 до limit (не включая), отражая их первую половину.
+    Parameters:
+    limit (int): Верхняя граница (не включительно)
+    Returns:
+    Список палиндромных чисел по возрастанию
+    """
+    palindromes: List[int] = []
+    half = 1
+    while True:
+        string_half = str(half)
+        odd_palindrome = int(string_half + string_half[-2::-1])
+        if odd_palindrome >= limit:
+            break
+        palindromes.append(odd_palindrome)
+        even_palindrome = int(string_half + string_half[::-1])
+        if even_palindrome < limit:
+            palindromes.append(even_palindrome)
+        half += 1
+    palindromes.sort()
+    return palindromes
 
 
 def simple_permutation(number: int) -> bool:
@@ -12,16 +81,63 @@ def simple_permutation(number: int) -> bool:
     Returns:
     True если все циклические перестановки являются простыми числами, иначе False
     """
-    string_number = str(number)
+    if not _is_prime(number):
+        return False
+    digits = len(str(number))
+    power = 10 ** (digits - 1)
+    perm = number
+    for _ in range(digits - 1):
+        perm = (perm % 10) * power + perm // 10
+        if not _is_prime(perm):
+            return False
+    return True
+
+
+@njit(cache=True)
+def _circular_primes_scan(limit: int) -> np.ndarray:
+    """
+    Находит круговые простые числа меньше limit: решето Эратосфена и арифметические повороты цифр.
+    Решето строится до ближайшей степени 10, чтобы повороты чисел не выходили за его границы.
+    """
+    bound = 10
+    while bound < limit:
+        bound *= 10
+    sieve = np.ones(bound, dtype=np.bool_)
+    sieve[:2] = False
+    for i in range(2, int(bound ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = False
+    found = np.empty(limit, dtype=np.int64)
     count = 0
-    list_perm = [int(string_number[i:] + string_number[:i]) for i in range(len(string_number))]
-    for perm in list_perm:
-        if isprime(perm):
+    for number in range(2, min(limit, 10)):
+        if sieve[number]:
+            found[count] = number
             count += 1
-    if count == len(list_perm):
-        return True
-    else:
-        return False
+    # В многозначном круговом простом нет цифр 0, 2, 4, 5, 6, 8: при повороте такая цифра
+    # встала бы в разряд единиц. Поэтому перебираются только числа из цифр 1, 3, 7, 9.
+    allowed_digits = np.array([1, 3, 7, 9])
+    length = 2
+    power = 10
+    while power < limit:
+        for code in range(4 ** length):
+            number = 0
+            divisor = 4 ** (length - 1)
+            for _ in range(length):
+                number = number * 10 + allowed_digits[(code // divisor) % 4]
+                divisor //= 4
+            if number >= limit:
+                break
+            if not sieve[number]:
+                continue
+            rotated = (number % 10) * power + number // 10
+            while rotated != number and sieve[rotated]:
+                rotated = (rotated % 10) * power + rotated // 10
+            if rotated == number:
+                found[count] = number
+                count += 1
+        length += 1
+        power *= 10
+    return found[:count]
 
 
 def palindromic_squares_and_circular_primes() -> tuple[List[int], List[int]]:
@@ -31,14 +147,8 @@ def palindromic_squares_and_circular_primes() -> tuple[List[int], List[int]]:
     Список палиндромных чисел до 10^5, которые остаются палиндромами при возведении в квадрат,
     список круговых простых чисел до 10^6 (все циклические перестановки являются простыми)
     """
-    palindromic: List[int] = []
-    for count in range(1, 10 ** 5):
-        if count == int(str(count)[::-1]) and count ** 2 == int(str(count)[::-1]) ** 2:
-            palindromic.append(count)
-    permutations: List[int] = []
-    for perm in range(1, 10 ** 6):
-        if simple_permutation(perm):
-            permutations.append(perm)
+    palindromic: List[int] = palindromes_below(10 ** 5)
+    permutations: List[int] = _circular_primes_scan(10 ** 6).tolist()
     return palindromic, permutations
 
 
@@ -48,10 +158,7 @@ def palindromic_cubes_and_palindromic_primes() -> tuple[List[int], List[int]]:
     Returns:
     Список палиндромных чисел до 10^5,палиндромы при возведении в куб, список палиндромных простых чисел до 10000
     """
-    palindromic: List[int] = []
-    for count in range(1, 10 ** 5):
-        if count == int(str(count)[::-1]) and count ** 3 == int(str(count)[::-1]) ** 3:
-            palindromic.append(count)
+    palindromic: List[int] = palindromes_below(10 ** 5)
     pal_primes: List[int] = []
     for prime in range(1, 10000):
         if prime == int(str(prime)[::-1]) and isprime(prime):
@@ -68,9 +175,9 @@ def primes_with_two_digits() -> Dict[str, List[int]]:
     def generate_numbers(digits, limit=100):
         primes = []
         max_len = 20
-        queue = [str(digits[0]), str(digits[1])]
+        queue = deque([str(digits[0]), str(digits[1])])
         while queue and len(primes) < limit:
-            num_str = queue.pop(0)
+            num_str = queue.popleft()
             num = int(num_str)
             if num > 1 and isprime(num):
                 primes.append(num)
@@ -86,7 +193,6 @@ def primes_with_two_digits() -> Dict[str, List[int]]:
     results = {}
     for pair in digit_pairs:
         results[f"1{str(pair[1])}"] = generate_numbers(pair, 100)
-    print(results)
     return results
 
 
@@ -98,21 +204,26 @@ def twin_primes_analysis(limit_pairs: int = 1000) -> Tuple[List[Tuple[int, int]]
     Returns:
     Кортеж изс писка пар простых чисел-близнецов, списка отношений pi_2(x)/pi(x) по мере нахождения пар
     """
-    num = 0
-    pi = 0
-    pi_2 = 0
     div_pi2pi = []
     list_limit_pairs = []
+    limit = 10 ** 5
     while len(list_limit_pairs) < limit_pairs:
-        num += 1
-        if isprime(num):
+        sieve = eratosthenes_sieve(limit + 2)
+        pi = 0
+        pi_2 = 0
+        div_pi2pi = []
+        list_limit_pairs = []
+        for num in range(2, limit + 1):
+            if not sieve[num]:
+                continue
             pi += 1
-        if isprime(num) and isprime(num + 2):
-            list_limit_pairs.append((num, num + 2))
-            div_pi2pi.append(pi_2 / pi)
-            pi_2 += 1
-    print(list_limit_pairs)
-    print(div_pi2pi)
+            if sieve[num + 2]:
+                list_limit_pairs.append((num, num + 2))
+                div_pi2pi.append(pi_2 / pi)
+                pi_2 += 1
+                if len(list_limit_pairs) == limit_pairs:
+                    break
+        limit *= 2
     return list_limit_pairs, div_pi2pi
 
 
@@ -121,23 +232,15 @@ def factorial_plus_one_factors() -> Dict[int, Dict[int, int]]:
     Факторизация чисел вида n! + 1 для n от 2 до 50.
     Returns:
     словари с разложением на простые множители
+    Note:
+    Факториал накапливается по ходу цикла. Основное время уходит на factorint
+    (rho Полларда, p-1, ECM); если установлен gmpy2, sympy сам использует арифметику GMP.
     """
-    primefactors_list = []
-    num_big_prime_digit = {}
     dict_for_numbers = {}
+    fact = 1
     for num in range(2, 51):
-        dict_for_number = {}
-        number = factorial(num) + 1
-        #        primefactors_list.append(len(primefactors(number)))
-        list_prime = primefactors(number)
-        # for j in list_prime:
-        #     if j > 10 ** 6:
-        #         num_big_prime_digit[num] = j
-        for i in list_prime:
-            dict_for_number[i] = list_prime.count(i)
-        dict_for_numbers[num] = dict_for_number
-    print(dict_for_numbers)
-    print(num_big_prime_digit)
+        fact *= num
+        dict_for_numbers[num] = dict(factorint(fact + 1))
     return dict_for_numbers
 
 
@@ -152,13 +255,10 @@ def euler_phi_direct(n: int) -> int:
     Прямой метод перебирает все числа от 1 до n и проверяет НОД с n.
     Эффективен для небольших n.
     """
-    count = 0
     if n <= 0:
         return 0
-    for num in range(1, n + 1):
-        if gcd(num, n) == 1:
-            count += 1
-    print(count)
+    step = 2 if n % 2 == 0 else 1  # при чётном n чётные числа заведомо не взаимно просты с n
+    count = sum(1 for num in range(1, n + 1, step) if gcd(num, n) == 1)
     return count
 
 
@@ -171,12 +271,12 @@ def euler_phi_factor(n: int) -> int:
     int: Количество чисел от 1 до n, взаимно простых с n
     Formula:
     phi(n) = n × П(1 - 1/p) для всех различных простых делителей p числа n
+    (считается в целых числах: phi = phi // p * (p - 1))
     """
     primefactors_n = primefactors(n)
     phi = n
     for prime in primefactors_n:
-        phi = int(phi * (1 - 1 / prime))
-    print(phi)
+        phi = phi // prime * (prime - 1)
     return phi
 
 
@@ -208,8 +308,8 @@ def compare_euler_phi_methods(test_values: List[int]) -> dict:
         method_times['sympy'] = time3
 
         time_results[test_value] = {'times': method_times}
-    print(time_results)
     return time_results
 
 
-compare_euler_phi_methods([1000, 15, 89])
+if __name__ == "__main__":
+    print(compare_euler_phi_methods([1000, 15, 89]))
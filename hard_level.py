@@ -1,4 +1,8 @@
 from typing import Union, List
+from math import gcd as _math_gcd
+import numpy as np
+from numba import njit
+from sympy import Poly, Symbol
 
 
 class RingElement:
@@ -34,17 +38,55 @@ class RingElement:
         return self.data == 0
 
 
-def _gcd_two_integers(a: int, b: int) -> int:
-    """ Вычисляет gcd двух целых чисел с помощью алгоритма Евклида
+def _trim(poly: List[float]) -> List[float]:
+    """ Отбрасывает ведущие (почти) нулевые коэффициенты полинома одним срезом
     Args:
-        a, b - целые числа для поиска gcd
+        poly: коэффициенты полинома [a_0, a_1, ..., a_n]
     Returns:
-        НОД a и b
+        коэффициенты без ведущих нулей (как минимум один коэффициент)
     """
-    a, b = abs(a), abs(b)
-    while b != 0:
-        a, b = b, a % b
-    return a
+    i = len(poly)
+    while i > 1 and abs(poly[i - 1]) < 1e-10:
+        i -= 1
+    return poly[:i]
+
+
+@njit(cache=True)
+def _trim_nb(poly: np.ndarray) -> np.ndarray:
+    """ _trim для массивов float64 (для вызова из скомпилированного кода) """
+    if poly.shape[0] == 0:
+        return np.zeros(1)
+    i = poly.shape[0]
+    while i > 1 and abs(poly[i - 1]) < 1e-10:
+        i -= 1
+    return poly[:i].copy()
+
+
+@njit(cache=True)
+def _is_zero_nb(poly: np.ndarray) -> bool:
+    """ Проверяет, что все коэффициенты полинома (почти) нулевые """
+    for c in poly:
+        if abs(c) >= 1e-10:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _polydiv_nb(dividend: np.ndarray, divisor: np.ndarray):
+    """ Деление полиномов с остатком на непрерывных массивах float64 (делитель без ведущих нулей) """
+    m = divisor.shape[0]
+    remainder = dividend.copy()
+    if remainder.shape[0] < m:
+        return np.zeros(1), remainder
+    quotient = np.empty(remainder.shape[0] - m + 1)
+    for shift in range(remainder.shape[0] - m, -1, -1):
+        coeff = remainder[shift + m - 1] / divisor[m - 1]
+        quotient[shift] = coeff
+        for i in range(m):
+            remainder[shift + i] -= coeff * divisor[i]
+    if m == 1:
+        return quotient, np.zeros(1)
+    return quotient, remainder[:m - 1]
 
 
 def _polynomial_division(dividend: List[float], divisor: List[float]):
@@ -56,25 +98,25 @@ def _polynomial_division(dividend: List[float], divisor: List[float]):
     Returns:
         кортеж из списков коэффициентов
     """
-    dividend = [element for element in dividend]
-    divisor = [element for element in divisor]
-    while len(dividend) > 1 and abs(dividend[-1]) < 1e-10: dividend.pop()
-    while len(divisor) > 1 and abs(divisor[-1]) < 1e-10: divisor.pop()
+    dividend = _trim(dividend)
+    divisor = _trim(divisor)
     if all(abs(c) < 1e-10 for c in divisor): raise ValueError("Ошибка деления на ноль")
-    quotient = []
-    while len(dividend) >= len(divisor):
-        if all(abs(c) < 1e-10 for c in dividend):
-            break
-        coeff = dividend[-1] / divisor[-1]
-        quotient.append(coeff)
-        degree_diff = len(dividend) - len(divisor)
-        for i in range(len(divisor)):
-            dividend[degree_diff + i] -= coeff * divisor[i]
-        dividend.pop()
-    quotient.reverse()
-    remainder = dividend if dividend else [0]
-    quotient = quotient if quotient else [0]
-    return quotient, remainder
+    if all(abs(c) < 1e-10 for c in dividend) or len(dividend) < len(divisor):
+        return [0], dividend
+    quotient, remainder = _polydiv_nb(np.asarray(dividend, dtype=np.float64), np.asarray(divisor, dtype=np.float64))
+    return quotient.tolist(), remainder.tolist()
+
+
+@njit(cache=True)
+def _gcd_poly_nb(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """ Алгоритм Евклида для полиномов, скомпилированный numba """
+    a = _trim_nb(a)
+    b = _trim_nb(b)
+    while not _is_zero_nb(b):
+        a, b = b, _trim_nb(_polydiv_nb(a, b)[1])
+    if abs(a[-1]) > 1e-10:  # сокращаю многочлен на старший коэффициент
+        a = a / a[-1]
+    return a
 
 
 def _gcd_two_polynomials(poly1: List[float], poly2: List[float]) -> List[float]:
@@ -84,23 +126,25 @@ def _gcd_two_polynomials(poly1: List[float], poly2: List[float]) -> List[float]:
     Returns:
         список коэффициентов НОД (нормализованный, старший коэффициент = 1)
     """
-    a = [element for element in poly1]
-    b = [element for element in poly2]
-
-    while len(a) > 1 and abs(a[-1]) < 1e-10: a.pop()
-    while len(b) > 1 and abs(b[-1]) < 1e-10: b.pop()
-
-    while not all(abs(c) < 1e-10 for c in b):
-        _, remainder = _polynomial_division(a, b)
-        a, b = b, remainder
-
-        while len(b) > 1 and abs(b[-1]) < 1e-10: b.pop()
+    a = np.asarray(poly1, dtype=np.float64)
+    b = np.asarray(poly2, dtype=np.float64)
+    return _gcd_poly_nb(a, b).tolist()
 
-    if a and abs(a[-1]) > 1e-10:  # сокращаю многочлен на старший коэффициент
-        leading_coeff = a[-1]
-        a = [c / leading_coeff for c in a]
 
-    return a
+def _gcd_integer_polynomials(polys: List[List[float]]) -> List[float]:
+    """ Вычисляет НОД полиномов с целыми коэффициентами точно, в Q[x] (через sympy.Poly).
+    Args:
+        polys: списки коэффициентов полиномов [a_0, a_1, ..., a_n]
+    Returns:
+        список коэффициентов НОД (нормализованный, старший коэффициент = 1)
+    """
+    x = Symbol('x')
+    result = Poly([int(c) for c in reversed(polys[0])], x, domain='QQ')
+    for poly in polys[1:]:
+        result = result.gcd(Poly([int(c) for c in reversed(poly)], x, domain='QQ'))
+        if result.is_one:  # НОД уже равен единице и дальше не уменьшится
+            break
+    return [float(c) for c in reversed(result.all_coeffs())]
 
 
 def gcd_ring_elements(elements: List[RingElement]):
@@ -118,14 +162,20 @@ def gcd_ring_elements(elements: List[RingElement]):
         if elem.is_polynomial != is_polynomial: raise ValueError("Все элементы должны быть одного типа")
 
     if is_polynomial:
+        if all(float(c).is_integer() for elem in elements for c in elem.data):
+            return RingElement(_gcd_integer_polynomials([elem.data for elem in elements]))
         result = elements[0].data[:]
         for i in range(1, len(elements)):
             result = _gcd_two_polynomials(result, elements[i].data)
+            if len(result) == 1 and abs(result[0]) > 1e-10:  # ненулевая константа — обратимый элемент
+                break
         return RingElement(result)
     else:
         result = abs(elements[0].data)
         for i in range(1, len(elements)):
-            result = _gcd_two_integers(result, abs(elements[i].data))
+            result = _math_gcd(result, elements[i].data)
+            if result == 1:
+                break
         return RingElement(result)
 
 
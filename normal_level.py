@@ -1,9 +1,103 @@
+import os
 import random
 from typing import Dict, List, Tuple, Union
 from sympy.combinatorics import SymmetricGroup, Permutation, PermutationGroup
-from sympy import factorial, gcd
-from itertools import product
-from galois import GF, Poly
+from sympy import factorial, gcd, primefactors, divisors
+from itertools import permutations, repeat
+from concurrent.futures import ProcessPoolExecutor
+from math import lcm
+from functools import lru_cache
+from math import gcd as int_gcd
+import numpy as np
+from numba import njit
+from galois import GF, Poly, egcd, gcd as poly_gcd
+
+
+def _pack_permutations(perms: np.ndarray) -> np.ndarray:
+    """
+    Упаковывает перестановки (строки массива (k, m), m <= 8) в int64: i-й полубайт хранит образ i.
+    """
+    shifts = 4 * np.arange(perms.shape[1], dtype=np.int64)
+    return np.bitwise_or.reduce(perms.astype(np.int64) << shifts, axis=1)
+
+
+def _unpack_permutations(packed: np.ndarray, m: int) -> np.ndarray:
+    """
+    Обратное к _pack_permutations: массив (k,) int64 -> строки образов (k, m) uint8.
+    """
+    shifts = 4 * np.arange(m, dtype=np.int64)
+    return ((packed[:, None] >> shifts) & 0xF).astype(np.uint8)
+
+
+@njit(cache=True)
+def _compose_packed(g: int, h: int, m: int) -> int:
+    """
+    Композиция упакованных перестановок: образ i равен g(h(i)).
+    """
+    result = 0
+    for i in range(m):
+        image = (h >> (4 * i)) & 0xF
+        result |= ((g >> (4 * image)) & 0xF) << (4 * i)
+    return result
+
+
+@njit(cache=True)
+def _rank_packed(perm: int, m: int) -> int:
+    """
+    Номер упакованной перестановки в лексикографическом порядке S_m (код Лемера).
+    """
+    rank = 0
+    for i in range(m):
+        image = (perm >> (4 * i)) & 0xF
+        smaller = 0
+        for j in range(i + 1, m):
+            if ((perm >> (4 * j)) & 0xF) < image:
+                smaller += 1
+        rank = rank * (m - i) + smaller
+    return rank
+
+
+@njit(cache=True)
+def _cyclic_subgroups_packed(elements: np.ndarray, m: int):
+    """
+    Все циклические подгруппы S_m по упакованным элементам в лексикографическом порядке.
+    Подгруппа <g> записывается как e, g, g^2, ... для первого в порядке перебора g;
+    остальные её порождающие g^k (k взаимно просто с |<g>|) помечаются и пропускаются.
+    Returns:
+    Плоский массив степеней всех подгрупп и смещения начала каждой подгруппы
+    """
+    identity = elements[0]
+    seen = np.zeros(elements.shape[0], dtype=np.bool_)
+    seen[0] = True
+    flat = [identity]  # тривиальная подгруппа {e}
+    offsets = [0, 1]
+    for index in range(elements.shape[0]):
+        if seen[index]:
+            continue
+        g = elements[index]
+        start = len(flat)
+        flat.append(identity)
+        power = g
+        while power != identity:
+            flat.append(power)
+            power = _compose_packed(g, power, m)
+        order = len(flat) - start
+        for k in range(1, order):
+            if int_gcd(k, order) == 1:
+                seen[_rank_packed(flat[start + k], m)] = True
+        offsets.append(len(flat))
+    return np.array(flat), np.array(offsets)
+
+
+def _coset_keys(cosets: np.ndarray, m: int) -> set:
+    """
+    Превращает массив смежных классов формы (k, |H|, m) в множество байтовых ключей,
+    не зависящих от порядка перестановок внутри класса.
+    """
+    rows = np.ascontiguousarray(cosets).view(f'S{m}')[..., 0]
+    rows = np.ascontiguousarray(np.sort(rows, axis=1))
+    flat = rows.view(np.uint8).reshape(rows.shape[0], -1)
+    return {row.tobytes() for row in flat}
 
 
 def subgroups_of_Sm(N: int) -> Dict:
@@ -21,45 +115,76 @@ def subgroups_of_Sm(N: int) -> Dict:
     """
     m = 4 + N % 5
 
-    group = SymmetricGroup(m)
-    group_elements = group.elements
+    # элементы S_m храним строками массива (m!, m): строка — образы 0..m-1
+    group_elements = np.array(list(permutations(range(m))), dtype=np.uint8)
     subgroup_counts = {4: 30, 5: 156, 6: 1455, 7: 11300, 8: 151221}
     count_subgroups = subgroup_counts[m]
 
-    cyclic_subgroups_set = set()
-    for g in group_elements:
-        cyclic_subgroup = group.subgroup([g])
-        subgroup_elements_tuple = tuple(sorted(cyclic_subgroup.elements, key=str))
-        cyclic_subgroups_set.add(subgroup_elements_tuple)
-
-    cyclic_subgroups = []
-    for elements_tuple in cyclic_subgroups_set:
-        subgroup = PermutationGroup(elements_tuple)
-        cyclic_subgroups.append(subgroup)
+    # циклические подгруппы перебираются в скомпилированном цикле над перестановками, упакованными в int64
+    flat, offsets = _cyclic_subgroups_packed(_pack_permutations(group_elements), m)
+    cyclic_subgroups = np.split(_unpack_permutations(flat, m), offsets[1:-1])
 
     random_subgroup = random.choice(cyclic_subgroups)
 
     subgroup_for_cosets = cyclic_subgroups[N % count_subgroups]
-    subgroup_elements = set(subgroup_for_cosets.generate())
-    left_cosets = set()
-    right_cosets = set()
+    # в sympy (g * h)(i) = h(g(i)), поэтому gH = H[:, g], а Hg = g[H]; смежные классы
+    # всех g строятся одним gather-ом, строки (перестановки) каждого класса сортируются как байтовые строки
+    left = subgroup_for_cosets[:, group_elements].transpose(1, 0, 2)
+    right = group_elements[:, subgroup_for_cosets]
+    left_cosets = _coset_keys(left, m)
+    right_cosets = _coset_keys(right, m)
 
-    for g in group_elements:
-        left_coset = frozenset(g * h for h in subgroup_elements)
-        right_coset = frozenset(h * g for h in subgroup_elements)
-        left_cosets.add(left_coset)
-        right_cosets.add(right_coset)
-
-    is_normal = (sorted(left_cosets) == sorted(right_cosets))
+    is_normal = (left_cosets == right_cosets)
+    index = len(group_elements) // len(subgroup_for_cosets)  # [S_m : H] = m! / |H| по теореме Лагранжа
 
     result = dict()
     result['Кол_во подгрупп'] = count_subgroups
-    result['Случайная подгруппа'] = list(random_subgroup.generate())
-    result[f'Индекс {list(subgroup_for_cosets.generate())}'] = len(left_cosets)
+    result['Случайная подгруппа'] = [Permutation(row.tolist()) for row in random_subgroup]
+    result[f'Индекс {[Permutation(row.tolist()) for row in subgroup_for_cosets]}'] = index
     result['Нормальная'] = is_normal
     return result
 
 
+def _cycle_lengths(perm: List[int]) -> List[int]:
+    """
+    Длины циклов перестановки, заданной списком образов (обход с пометкой посещённых).
+    """
+    visited = [False] * len(perm)
+    lengths = []
+    for start in range(len(perm)):
+        if visited[start]:
+            continue
+        length = 0
+        i = start
+        while not visited[i]:
+            visited[i] = True
+            i = perm[i]
+            length += 1
+        lengths.append(length)
+    return lengths
+
+
+def _power_by_cycles(perm: List[int], n: int) -> List[int]:
+    """
+    Возводит перестановку (список образов) в степень n: каждый цикл длины L сдвигается на n % L.
+    """
+    power = [0] * len(perm)
+    visited = [False] * len(perm)
+    for start in range(len(perm)):
+        if visited[start]:
+            continue
+        cycle = []
+        i = start
+        while not visited[i]:
+            visited[i] = True
+            cycle.append(i)
+            i = perm[i]
+        shift = n % len(cycle)
+        for pos, point in enumerate(cycle):
+            power[point] = cycle[(pos + shift) % len(cycle)]
+    return power
+
+
 def element_powers_in_Sm(N: int) -> Dict:
     """
     Анализ степеней элементов и порожденных ими подгрупп в симметрической группе.
@@ -78,26 +203,24 @@ def element_powers_in_Sm(N: int) -> Dict:
     n2 = (N + 1) % 6
     n3 = (N + 2) % 6
 
-    group = SymmetricGroup(m)
-    group_elements = list(group.generate())
-
-    element = group_elements[N % factorial(m)]
-    element_n1 = element ** n1
-    element_n2 = element ** n2
-    element_n3 = element ** n3
+    element = Permutation.unrank_lex(m, int(N % factorial(m)))
+    element_n1 = Permutation(_power_by_cycles(element.array_form, n1))
+    element_n2 = Permutation(_power_by_cycles(element.array_form, n2))
+    element_n3 = Permutation(_power_by_cycles(element.array_form, n3))
 
-    group_n1 = group.subgroup([element_n1])
-    group_n2 = group.subgroup([element_n2])
-    group_n3 = group.subgroup([element_n3])
+    # порядок циклической подгруппы <g> равен порядку g, т.е. НОК длин циклов
+    order_n1 = lcm(*_cycle_lengths(element_n1.array_form))
+    order_n2 = lcm(*_cycle_lengths(element_n2.array_form))
+    order_n3 = lcm(*_cycle_lengths(element_n3.array_form))
 
     orders = dict()
     orders['g'] = element
-    orders['o(g_n1)'] = [element_n1, element_n1.order()]
-    orders['o(g_n2)'] = [element_n2, element_n2.order()]
-    orders['o(g_n3)'] = [element_n3, element_n3.order()]
-    orders['|<g_n1>|'] = [str(group_n1), group_n1.order()]
-    orders['|<g_n2>|'] = [str(group_n2), group_n2.order()]
-    orders['|<g_n3>|'] = [str(group_n3), group_n3.order()]
+    orders['o(g_n1)'] = [element_n1, order_n1]
+    orders['o(g_n2)'] = [element_n2, order_n2]
+    orders['o(g_n3)'] = [element_n3, order_n3]
+    orders['|<g_n1>|'] = [str(PermutationGroup([element_n1])), order_n1]
+    orders['|<g_n2>|'] = [str(PermutationGroup([element_n2])), order_n2]
+    orders['|<g_n3>|'] = [str(PermutationGroup([element_n3])), order_n3]
     return orders
 
 
@@ -117,15 +240,22 @@ def solve_sigma_power_eq(N: int) -> Dict:
     m = 4 + N % 5
 
     group = SymmetricGroup(m)
-    group_elements = list(group.generate())
 
     solutions = set()
     answer = list(range(1, m))
     answer.append(0)
-    for element in group_elements:
-        for n in range(element.order()):
-            if element ** n == Permutation(answer):
+    target = Permutation(answer)
+    target_order = target.order()
+    for element in group.generate():  # элементы перебираются по одному, без списка из m! перестановок
+        element_order = element.order()
+        if element_order % target_order != 0:  # порядок σ^n делит порядок σ
+            continue
+        power = Permutation(list(range(m)))
+        for n in range(element_order):
+            if power == target:
                 solutions.add(element)
+                break
+            power = power * element
 
     result = dict()
     result['Кол-во решений'] = len(solutions)
@@ -150,14 +280,15 @@ def elements_of_order_k_in_cyclic_group(N: int) -> Dict:
     k = 1 + N % 7
 
     group = SymmetricGroup(m)
-    group_elements = list(group.generate())
 
     list_power = list()
     list_orders = list()
-    for element in group_elements:
-        if element ** k == Permutation(range(m)):
+    for element in group.generate():
+        # g^k = e <=> длина каждого цикла делит k; o(g) = НОК длин циклов
+        lengths = _cycle_lengths(element.array_form)
+        if all(k % length == 0 for length in lengths):
             list_power.append(element)
-        if element.order() == k:
+        if lcm(*lengths) == k:
             list_orders.append(element)
 
     result = dict()
@@ -166,6 +297,18 @@ def elements_of_order_k_in_cyclic_group(N: int) -> Dict:
     return result
 
 
+@lru_cache(maxsize=None)
+def _multiplication_table_mod(m: int) -> np.ndarray:
+    """
+    Таблица умножения по модулю m: table[a, b] = a * b mod m (только для чтения, общая для всех вызовов).
+    Строка table[t] — это кратные t * i mod m, т.е. циклическая подгруппа <t> аддитивной группы Z_m.
+    """
+    residues = np.arange(m)
+    table = np.outer(residues, residues) % m
+    table.flags.writeable = False
+    return table
+
+
 def subgroups_of_Zm_star(N: int) -> List[List[int]]:
     """
     Нахождение всех подгрупп мультипликативной группы вычетов по модулю m.
@@ -181,21 +324,30 @@ def subgroups_of_Zm_star(N: int) -> List[List[int]]:
     """
     m = 4 + N % 5
     units = [a for a in range(1, m) if gcd(a, m) == 1]
+    multiplication = _multiplication_table_mod(m)
     subgroups_set = set()
-    subgroups_set.add(tuple([1]))
+    subgroups_set.add(frozenset([1]))
     for g in units:
-        subgroup = []
+        subgroup = set()
         x = g
         while x not in subgroup:
-            subgroup.append(x)
-            x = (x * g) % m
-        subgroup_tuple = tuple(sorted(subgroup))
-        subgroups_set.add(subgroup_tuple)
-    result = [list(t) for t in subgroups_set]
+            subgroup.add(x)
+            x = int(multiplication[x, g])
+        subgroups_set.add(frozenset(subgroup))
+    result = [sorted(subgroup) for subgroup in subgroups_set]
     result.sort(key=lambda x: (len(x), x))
     return result
 
 
+def _multiplicative_order(a: int, p: int) -> int:
+    """
+    Порядок элемента a в F_p^*: наименьший делитель d числа p - 1, для которого a^d = 1 (mod p).
+    """
+    for d in divisors(p - 1):
+        if pow(a, d, p) == 1:
+            return d
+
+
 def order_of_sr(N: int) -> int:
     """
     Вычисление порядка элемента в мультипликативной группе простого поля.
@@ -214,11 +366,7 @@ def order_of_sr(N: int) -> int:
         p = 31
     s = 4  # тк N = 1
     r = 60  # N = 1
-    temp = s % p
-    m = 1
-    while temp != 1:
-        temp = (temp * s) % p
-        m += 1
+    m = _multiplicative_order(s, p)
 
     gcd_ord = gcd(m, r)
     return m // gcd_ord
@@ -241,12 +389,9 @@ def order_and_primitivity_of_t(N: int) -> Dict[int, str]:
     if N == 1:
         p = 31
     t = 8
-    m = 1
-    temp = t % p
-    while temp != 1:
-        temp = (temp * t) % p
-        m += 1
-    if m == p - 1:
+    m = _multiplicative_order(t, p)
+    # тест Люка: t примитивен <=> t^((p-1)/q) != 1 для каждого простого q | p-1
+    if all(pow(t, (p - 1) // q, p) != 1 for q in primefactors(p - 1)):
         return {m: 'YES'}
     else:
         return {m: 'NO'}
@@ -267,14 +412,13 @@ def generators_of_Zm_star(N: int) -> List[int]:
     """
     elem_list = []
     m = 4 + N % 5
-    group_order = m - 1
-    for elem in range(1, m):
-        el_ord = 1
-        temp = elem % m
-        while temp != 1:
-            temp = (temp * elem) % m
-            el_ord += 1
-        if el_ord == group_order:
+    units = [a for a in range(1, m) if gcd(a, m) == 1]
+    group_order = len(units)  # |Z_m^*| = phi(m)
+    # по теореме Лагранжа порядок элемента делит phi(m), поэтому elem порождает группу
+    # тогда и только тогда, когда elem^(phi(m)/p) != 1 для каждого простого p | phi(m)
+    group_order_primes = primefactors(group_order)
+    for elem in units:
+        if all(pow(elem, group_order // p, m) != 1 for p in group_order_primes):
             elem_list.append(elem)
     return elem_list
 
@@ -295,9 +439,7 @@ def cyclic_subgroup_in_Zm_additive(N: int) -> Dict[int, List[int]]:
     m = 4 + N % 5
     t_base = 8
     t = t_base % m
-    subgroup = set()
-    for i in range(m):
-        subgroup.add((t * i) % m)
+    subgroup = set(_multiplication_table_mod(m)[t].tolist())  # {t * i mod m}
     subgroup_order = len(subgroup)
     primitive_elements = []
     for elem in subgroup:
@@ -324,36 +466,45 @@ def isomorphism_of_cyclic_subgroup_Zm_star(N: int) -> Dict[int, Tuple[set, str]]
     m = 4 + N % 5
     t_old = 8
     t = t_old % m
-    subgroup = set()
-    for i in range(1, m):
-        subgroup.add((i * t) % m)
+    subgroup = set(_multiplication_table_mod(m)[t, 1:].tolist())  # {i * t mod m : 1 <= i < m}
     d = len(subgroup)
     cyclic_group = f"<(1 2 ... {d})> при S{d}"
     return {d: (subgroup, cyclic_group)}
 
 
-def ai(N: int, i: int) -> int:
-    return (i + N) % 4
-
-
-def bj(N: int, j: int) -> int:
-    return (j + N) % 7
-
-
-def ck(N: int, k: int) -> int:
-    return (k + N) % 5
-
-
-def dl(N: int, l: int) -> int:
-    return (l + N) % 9
+@lru_cache(maxsize=None)
+def _gf(q: int):
+    """
+    Класс поля GF(q): создаётся один раз на каждое q и переиспользуется между вызовами.
+    """
+    return GF(q)
 
 
-def rm(N: int, m: int) -> int:
-    return (m + N) % 11
+@lru_cache(maxsize=None)
+def _gf_range(q: int):
+    """
+    Все элементы поля GF(q) (в целочисленном представлении 0..q-1) одним массивом поля.
+    """
+    field = _gf(q)
+    return np.arange(q, dtype=field.dtypes[0]).view(field)
 
 
-def st(N: int, t: int) -> int:
-    return (t + N) % 11
+def _shifted_coefficients(N: int, degree: int, modulus: int, field, leading: bool = False):
+    """
+    Коэффициенты (i + N) mod modulus для i = degree, ..., 0 одним массивом поля.
+    Parameters:
+    N (int): Входной параметр для вариативности вычислений
+    degree (int): Старший индекс i
+    modulus (int): Модуль, по которому берутся коэффициенты
+    field: Поле GF(q), в котором строятся коэффициенты
+    leading (bool): Добавить ли старший коэффициент 1 перед остальными
+    Returns:
+    Массив коэффициентов поля от старшего к младшему
+    """
+    coefficients = (np.arange(degree, -1, -1) + N) % modulus
+    if leading:
+        coefficients = np.concatenate(([1], coefficients))
+    return field(coefficients)
 
 
 def roots_F4(N: int) -> List[str]:
@@ -369,8 +520,8 @@ def roots_F4(N: int) -> List[str]:
     Returns:
     List[str]: Список корней полинома в строковом представлении
     """
-    field = GF(4)
-    coefficients = [field(1)] + [field(ai(N, i)) for i in range(8, -1, -1)]
+    field = _gf(4)
+    coefficients = _shifted_coefficients(N, 8, 4, field, leading=True)
     func = Poly(coefficients, field=field)
     roots = [str(root) for root in func.roots()]
     return roots
@@ -386,8 +537,8 @@ def roots_F7(N: int) -> List[str]:
     Returns:
     List[str]: Список корней полинома в строковом представлении
     """
-    field = GF(7)
-    coefficients = [field(bj(N, i)) for i in range(6, -1, -1)]
+    field = _gf(7)
+    coefficients = _shifted_coefficients(N, 6, 7, field)
     func = Poly(coefficients, field=field)
     roots = [str(root) for root in func.roots()]
     return roots
@@ -403,8 +554,8 @@ def reducibility_F5(N: int) -> str:
     Returns
     str: Строка с разложением полинома на множители
     """
-    field = GF(5)
-    coefficients = [field(1)] + [field((ck(N, i))) for i in range(4, -1, -1)]
+    field = _gf(5)
+    coefficients = _shifted_coefficients(N, 4, 5, field, leading=True)
     func = Poly(coefficients, field=field)
     factors = func.factors()
 
@@ -424,8 +575,8 @@ def reducibility_F9(N: int) -> str:
     Returns:
     str: Строка с разложением полинома на множители
     """
-    field = GF(9)
-    coefficients = [field(1)] + [field((dl(N, i))) for i in range(3, -1, -1)]
+    field = _gf(9)
+    coefficients = _shifted_coefficients(N, 3, 9, field, leading=True)
     func = Poly(coefficients, field=field)
     factors = func.factors()
     result = 'f(x) ='
@@ -444,39 +595,14 @@ def gcd_F11(N: int) -> str:
     Returns:
     str: Строка с линейным представлением НОД
     """
-    field = GF(11)
-    coefficients_f = [field((rm(N, i))) for i in range(7, -1, -1)]
-    coefficients_g = [field((st(N, i))) for i in range(3, -1, -1)]
+    field = _gf(11)
+    coefficients_f = _shifted_coefficients(N, 7, 11, field)
+    coefficients_g = _shifted_coefficients(N, 3, 11, field)
     func_f = Poly(coefficients_f, field=field)
     func_g = Poly(coefficients_g, field=field)
 
-    table1 = [func_f, field(1), field(0)]
-    table2 = [func_g, field(0), field(1)]
-    while table1[0] != field(0) and table2[0] != field(0):
-        if table1[0].degree > table2[0].degree:
-            coef_to_multiply = [1] + [0 for _ in range(table1[0].degree - table2[0].degree)]
-            table1[0] -= table2[0] * Poly(coef_to_multiply, field=field)
-            table1[1] -= table2[1] * Poly(coef_to_multiply, field=field)
-            table1[2] -= table2[2] * Poly(coef_to_multiply, field=field)
-        elif table1[0].degree < table2[0].degree:
-            coef_to_multiply = [1] + [0 for _ in range(table2[0].degree - table1[0].degree)]
-            table2[0] -= table1[0] * Poly(coef_to_multiply, field=field)
-            table2[1] -= table1[1] * Poly(coef_to_multiply, field=field)
-            table2[2] -= table1[2] * Poly(coef_to_multiply, field=field)
-        else:
-            if table1[0].coeffs[0] >= table2[0].coeffs[0]:
-                table1[0] -= table2[0]
-                table1[1] -= table2[1]
-                table1[2] -= table2[2]
-            else:
-                table2[0] -= table1[0]
-                table2[1] -= table1[1]
-                table2[2] -= table1[2]
-
-    if table1[0] == field(0):
-        return f'{table2[0]} = ({func_f}) * ({table2[1]}) + ({func_g}) * ({table2[2]})'
-    else:
-        return f'{table1[0]} = ({func_f}) * ({table1[1]}) + ({func_g} * {table1[2]})'
+    func_d, func_s, func_t = egcd(func_f, func_g)
+    return f'{func_d} = ({func_f}) * ({func_s}) + ({func_g}) * ({func_t})'
 
 
 def inverse_F13(N: int) -> Union[str, Tuple[str, str]]:
@@ -489,73 +615,63 @@ def inverse_F13(N: int) -> Union[str, Tuple[str, str]]:
     Returns:
     Union[str, Tuple[str, str]]: Результат поиска обратного элемента или сообщение о необратимости
     """
-    field = GF(13)
-    coefficients_f = [field((st(N, i))) for i in range(3, -1, -1)]
+    field = _gf(13)
+    coefficients_f = _shifted_coefficients(N, 3, 11, field)
     coefficients_g = [1, 0, 0, 0, 1, 1, 0, 6, 2]
     func_f = Poly(coefficients_f, field=field)
     func_g = Poly(coefficients_g, field=field)
 
-    table1 = [func_f, field(1), field(0)]
-    table2 = [func_g, field(0), field(1)]
-    while table1[0] != field(0) and table2[0] != field(0):
-        if table1[0].degree > table2[0].degree:
-            coef_to_multiply = [1] + [0 for _ in range(table1[0].degree - table2[0].degree)]
-            table1[0] -= table2[0] * Poly(coef_to_multiply, field=field)
-            table1[1] -= table2[1] * Poly(coef_to_multiply, field=field)
-            table1[2] -= table2[2] * Poly(coef_to_multiply, field=field)
-        elif table1[0].degree < table2[0].degree:
-            coef_to_multiply = [1] + [0 for _ in range(table2[0].degree - table1[0].degree)]
-            table2[0] -= table1[0] * Poly(coef_to_multiply, field=field)
-            table2[1] -= table1[1] * Poly(coef_to_multiply, field=field)
-            table2[2] -= table1[2] * Poly(coef_to_multiply, field=field)
-        else:
-            if table1[0].coeffs[0] >= table2[0].coeffs[0]:
-                table1[0] -= table2[0]
-                table1[1] -= table2[1]
-                table1[2] -= table2[2]
-            else:
-                table2[0] -= table1[0]
-                table2[1] -= table1[1]
-                table2[2] -= table1[2]
-
-    if table1[0] == field(0):
-        if table2[0].degree != 0:
-            return 'необратим'
-        func_h = table2[1] // table2[0]
-    else:
-        if table1[0].degree != 0:
-            return 'необратим'
-        func_h = table1[1] // table1[0]
+    func_d, func_h, _ = egcd(func_f, func_g)
+    if func_d.degree != 0:
+        return 'необратим'
 
     return f'({func_h}) * ({func_f}) ≡ 1 mod ({func_g})', f'h(x) = {func_h}'
 
 
-def generate_irreducible_polynomials(q: int, d: int) -> List[str]:
+def _pow_mod(base: Poly, exponent: int, modulus: Poly) -> Poly:
     """
-    Генерация всех неприводимых полиномов заданной степени над конечным полем.
-    Перебирает все монтические полиномы степени d над полем F_q
-    и проверяет их на неприводимость.
-    Parameters:
-    q (int): Характеристика поля
-    d (int): Степень полиномов
-    Returns:
-    List[str]: Список неприводимых полиномов в строковом представлении
+    Возведение полинома в степень по модулю (бинарное возведение через * и %).
     """
-    field = GF(q)
-    irreducibles = []
+    result = Poly([1], field=modulus.field)
+    while exponent > 0:
+        if exponent & 1:
+            result = (result * base) % modulus
+        base = (base * base) % modulus
+        exponent >>= 1
+    return result
+
+
+PARALLEL_MIN_CANDIDATES = 2048
 
-    for part_coefs in product([field(i) for i in range(q)], repeat=d):
-        coefficients = [field(1)] + list(part_coefs)
+
+def _irreducibles_in_range(q: int, d: int, start: int, stop: int) -> List[str]:
+    """
+    Проверяет тестом Рабина монические полиномы степени d над F_q с номерами start..stop-1.
+    Номер кандидата — запись его младших d коэффициентов в системе счисления с основанием q
+    (тот же порядок, что у product по элементам поля).
+    """
+    field = _gf(q)
+    irreducibles = []
+    x = Poly([1, 0], field=field)
+    field_elements = _gf_range(q)
+    d_primes = primefactors(d)
+
+    indices = np.arange(start, stop)
+    digits = (indices[:, None] // q ** np.arange(d - 1, -1, -1)) % q
+    candidates = field(np.hstack((np.ones((len(indices), 1), dtype=digits.dtype), digits)))
+    for coefficients in candidates:
         func_f = Poly(coefficients, field=field)
-        reducible = False
-        for deg_g in range(1, d // 2 + 1):
-            for coefs_g in product([field(i) for i in range(q)], repeat=deg_g):
-                g = Poly([field(1)] + list(coefs_g), field=field)
-                if func_f % g == 0:
-                    reducible = True
-                    break
+        if d > 1 and not func_f(field_elements).all():  # есть корень => есть линейный множитель
+            continue
+        # тест Рабина: f неприводим <=> f | x^(q^d) - x и gcd(f, x^(q^(d/p)) - x) = 1 для простых p | d
+        frobenius = [x % func_f]  # frobenius[k] = x^(q^k) mod f
+        for _ in range(d):
+            frobenius.append(_pow_mod(frobenius[-1], q, func_f))
+        reducible = frobenius[d] != frobenius[0]
+        for p in d_primes:
             if reducible:
                 break
+            reducible = poly_gcd(frobenius[d // p] - x, func_f).degree != 0
 
         if not reducible:
             irreducibles.append(str(func_f))
@@ -563,5 +679,29 @@ def generate_irreducible_polynomials(q: int, d: int) -> List[str]:
     return irreducibles
 
 
+def generate_irreducible_polynomials(q: int, d: int) -> List[str]:
+    """
+    Генерация всех неприводимых полиномов заданной степени над конечным полем.
+    Перебирает все монтические полиномы степени d над полем F_q
+    и проверяет их на неприводимость тестом Рабина.
+    Кандидаты независимы, поэтому при большом их числе перебор делится на диапазоны
+    и выполняется в нескольких процессах.
+    Parameters:
+    q (int): Характеристика поля
+    d (int): Степень полиномов
+    Returns:
+    List[str]: Список неприводимых полиномов в строковом представлении
+    """
+    total = q ** d
+    workers = os.cpu_count() or 1
+    if workers == 1 or total < PARALLEL_MIN_CANDIDATES:
+        return _irreducibles_in_range(q, d, 0, total)
+
+    bounds = np.linspace(0, total, 4 * workers + 1).astype(int).tolist()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(_irreducibles_in_range, repeat(q), repeat(d), bounds[:-1], bounds[1:])
+        return [poly for part in parts for poly in part]
+
+
 ISU = 502701
 N = ISU % 20
\ No newline at end of file